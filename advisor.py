@@ -7,11 +7,40 @@ from config import (
     CSV_FILE,
     JSON_FILE,
     LOGS_DIR,
+    STATE_FILE,
     TICKERS,
+    STOP_LOSS_PCT,
+    PRICE_TOLERANCE_PCT,
+    PERF_TOLERANCE_PCT,
+    INPUT_MAX_AGE_MINUTES,
+    GPT_SUGGESTION_TTL_MINUTES,
+    MAX_SECTOR_WEIGHT,
+    MIN_SUGGESTION_LIQUIDITY,
+    CORRELATION_PENALTY,
 )
 from fetch_prices import get_stock_performance, get_prices
 from analyze import suggest_high_performing_tickers
 from news_fetcher import get_company_news
+from analytics import update_analytics, volatility_stop_pcts, diversify_weights
+from pipeline import Stage, run_stages, fan_out, print_critical_path
+from symbols import (
+    get_index,
+    get_sector,
+    is_cash_symbol,
+    tradable_symbols,
+    validate_symbols,
+)
+from advisor_state import (
+    new_state,
+    load_state,
+    save_state,
+    now_iso,
+    is_stale,
+    pct_moved,
+    points_moved,
+    headline_fingerprint,
+    diff_recommendations,
+)
 
 
 # -----------------------------
@@ -61,7 +90,7 @@ def convert_schwab_csv(csv_file, json_file):
             market_value = 0.0
 
         # Handle cash/money market
-        if "CASH" in symbol.upper() or "MONEY MARKET" in sec_type:
+        if is_cash_symbol(symbol) or "MONEY MARKET" in sec_type:
             cash_balance += market_value
             continue
 
@@ -108,26 +137,390 @@ def print_ticker_headlines(headlines):
             print(f"     * {headline}")
 
 
+def print_recommendation_changes(changes, recomputed):
+    print(
+        f"\nRecomputed {len(recomputed)} ticker(s): {', '.join(recomputed) or 'none'}"
+    )
+    if not any(changes.values()):
+        print("No changes since the previous run.")
+        return
+
+    print("Changes since the previous run:")
+    for rec in changes["added"]:
+        print(f" + {rec['action'].title()} {rec['shares']} shares of {rec['ticker']}")
+    for rec in changes["removed"]:
+        print(f" - {rec['action'].title()} {rec['shares']} shares of {rec['ticker']}")
+    for change in changes["changed"]:
+        print(
+            f" ~ {change['action'].title()} {change['ticker']}: "
+            f"{change['before']['shares']} → {change['after']['shares']} shares"
+        )
+
+
+# -----------------------------
+# Incremental Inputs
+# -----------------------------
+def refresh_ticker_inputs(ticker, price, state, with_news=False):
+    """
+    Return the per-ticker inputs and derived signals, refetching only when needed.
+
+    The cached entry is reused as-is when the price is within
+    PRICE_TOLERANCE_PCT of the last checked price and the entry is younger than
+    INPUT_MAX_AGE_MINUTES. Otherwise performance (and news) are refetched; if
+    the headlines are unchanged and performance is within PERF_TOLERANCE_PCT
+    points, the previous signals are kept.
+
+    Returns: dict with price, pct_change, headlines, headline_fp,
+    negative_news and checked_at
+    """
+    previous = state["tickers"].get(ticker)
+    has_news = previous is not None and previous.get("headline_fp") is not None
+
+    if (
+        previous
+        and (has_news or not with_news)
+        and not pct_moved(previous.get("price"), price, PRICE_TOLERANCE_PCT)
+        and not is_stale(previous.get("checked_at"), INPUT_MAX_AGE_MINUTES)
+    ):
+        return previous
+
+    perf = get_stock_performance(ticker, period="1mo")
+    pct_change = float(perf["pct_change"]) if perf else None
+
+    fetch_news = with_news or has_news
+    headlines = get_company_news(ticker) if fetch_news else []
+    fingerprint = headline_fingerprint(headlines) if fetch_news else None
+
+    if (
+        previous
+        and fingerprint == previous.get("headline_fp")
+        and not points_moved(previous.get("pct_change"), pct_change, PERF_TOLERANCE_PCT)
+    ):
+        previous["price"] = price
+        previous["checked_at"] = now_iso()
+        return previous
+
+    entry = {
+        "price": price,
+        "pct_change": pct_change,
+        "headlines": headlines,
+        "headline_fp": fingerprint,
+        "negative_news": contains_negative_news(
+            [h.get("title", "") for h in headlines]
+        ),
+        "checked_at": now_iso(),
+    }
+    state["tickers"][ticker] = entry
+    state["recomputed"].append(ticker)
+    return entry
+
+
+def get_gpt_suggestions(state, exclude, max_count=5):
+    """
+    Ask GPT for extra tickers from the symbol store, reusing the previous
+    answer within its TTL.
+    """
+    exclude = sorted(exclude)
+    cached = state.get("gpt_suggestions")
+    if (
+        cached
+        and cached.get("exclude") == exclude
+        and not is_stale(cached.get("fetched_at"), GPT_SUGGESTION_TTL_MINUTES)
+    ):
+        return cached["tickers"]
+
+    # Point GPT at the validated store so its picks survive validation below
+    suggestions = suggest_high_performing_tickers(
+        preferred_universe=tradable_symbols(MIN_SUGGESTION_LIQUIDITY),
+        exclude=exclude,
+        max_count=max_count,
+    )
+
+    # Reject unknown or illiquid symbols before any prices are fetched for them
+    tickers, rejected = validate_symbols(suggestions, MIN_SUGGESTION_LIQUIDITY)
+    if rejected:
+        print(f"Ignoring unknown or illiquid GPT suggestions: {', '.join(rejected)}")
+
+    state["gpt_suggestions"] = {
+        "tickers": tickers,
+        "exclude": exclude,
+        "fetched_at": now_iso(),
+    }
+    return tickers
+
+
+def allocate_if_changed(
+    candidates, prices, cash_balance, headlines, state, analytics=None
+):
+    """
+    Allocate cash across candidates, reusing the previous run's weights when
+    the candidates, their scores, the analytics date and the weighting config
+    are unchanged. Shares are always sized from the current prices and cash.
+    """
+    key = {
+        "candidates": [[t, score] for t, score in candidates],
+        "analytics_as_of": (analytics or {}).get("as_of"),
+        "max_sector_weight": MAX_SECTOR_WEIGHT,
+        "correlation_penalty": CORRELATION_PENALTY,
+    }
+    cached = state.get("allocation")
+    if cached and cached.get("key") == key:
+        weights = cached["weights"]
+    else:
+        weights = allocation_weights(candidates, analytics)
+        state["allocation"] = {"key": key, "weights": weights}
+
+    return allocate_cash_weighted_by_performance(
+        candidates, prices, cash_balance, headlines, analytics, weights=weights
+    )
+
+
 # -----------------------------
 # Advisor Logic (Buy/Sell)
 # -----------------------------
-def analyze_holdings(account_data):
+def analyze_holdings(account_data, state=None):
+    """
+    Build buy/sell recommendations for the account's holdings.
+
+    The fetches run as a stage graph: holdings prices and GPT suggestions
+    start together, news/performance per holding overlaps with the GPT
+    tickers' prices, and the sell/buy rules run once their inputs are ready.
+    """
+    state = state if state is not None else new_state()
     holdings = account_data.get("holdings", [])
     cash_balance = account_data.get("cash_balance", 0.0)
 
     # Starter stocks if no holdings or zero shares
     if not holdings or all(h.get("shares", 0) == 0 for h in holdings):
-        return analyze_starter(account_data)
+        return analyze_starter(account_data, state)
 
     tickers = [h["ticker"] for h in holdings]
-    prices = get_prices(tickers)
 
-    recommendations = {"buy": [], "sell": []}
+    def buy(prices, gpt_suggestions, gpt_prices, holding_inputs, gpt_inputs, analytics):
+        all_prices = merge_prices(prices, gpt_prices)
+        positive_candidates = collect_positive_candidates(
+            tickers, {}, prices=all_prices, state=state, inputs=holding_inputs
+        )
+        positive_candidates.extend(
+            collect_positive_candidates(
+                gpt_suggestions, {}, prices=all_prices, state=state, inputs=gpt_inputs
+            )
+        )
+
+        # Allocate cash proportionally to performance using the shared helper
+        buy_recs = allocate_if_changed(
+            positive_candidates, all_prices, cash_balance, {}, state, analytics
+        )
+
+        # Fallback buy: QQQ if significant cash remains
+        if cash_balance > 500:
+            price = all_prices.get("QQQ")
+            if price and price > 0:
+                shares = round(cash_balance / price, 3)
+                if shares > 0:
+                    buy_recs = buy_recs + [
+                        {
+                            "ticker": "QQQ",
+                            "shares": shares,
+                            "cost_usd": round(shares * price, 2),
+                            "reason": "Tech sector momentum placeholder",
+                        }
+                    ]
+        return {
+            "buy": buy_recs,
+            "unallocated_cash": sector_capped_cash(
+                state["allocation"]["weights"], cash_balance
+            ),
+        }
+
+    stages = [
+        Stage("prices", lambda: get_prices(tickers), outputs=["prices"]),
+        Stage("analytics", lambda: update_analytics(tickers), outputs=["analytics"]),
+        # Ask GPT for additional high-performing tickers not already held
+        Stage(
+            "gpt_suggestions",
+            lambda: get_gpt_suggestions(state, exclude=tickers, max_count=5),
+            outputs=["gpt_suggestions"],
+        ),
+        Stage(
+            "holding_inputs",
+            lambda prices: fetch_ticker_inputs(tickers, prices, state, with_news=True),
+            inputs=["prices"],
+            outputs=["holding_inputs"],
+        ),
+        Stage(
+            "gpt_prices",
+            lambda gpt_suggestions: get_prices(gpt_suggestions),
+            inputs=["gpt_suggestions"],
+            outputs=["gpt_prices"],
+        ),
+        Stage(
+            "gpt_inputs",
+            lambda gpt_suggestions, gpt_prices: fetch_ticker_inputs(
+                gpt_suggestions, gpt_prices, state
+            ),
+            inputs=["gpt_suggestions", "gpt_prices"],
+            outputs=["gpt_inputs"],
+        ),
+        Stage(
+            "sell",
+            lambda prices, holding_inputs, analytics: sell_recommendations(
+                holdings,
+                prices,
+                holding_inputs,
+                stop_pcts=volatility_stop_pcts(analytics, tickers),
+            ),
+            inputs=["prices", "holding_inputs", "analytics"],
+            outputs=["sell"],
+        ),
+        Stage(
+            "buy",
+            buy,
+            inputs=[
+                "prices",
+                "gpt_suggestions",
+                "gpt_prices",
+                "holding_inputs",
+                "gpt_inputs",
+                "analytics",
+            ],
+            outputs=["buy", "unallocated_cash"],
+        ),
+    ]
+    get_index()  # load the symbol store before stages read it concurrently
+    values, state["pipeline"] = run_stages(stages)
+
+    recommendations = {
+        "buy": values["buy"],
+        "sell": values["sell"],
+        "unallocated_cash": values["unallocated_cash"],
+    }
+    headlines = {
+        ticker: inputs["headlines"]
+        for ticker, inputs in values["holding_inputs"].items()
+    }
+    prices = merge_prices(values["prices"], values["gpt_prices"])
+    return recommendations, headlines, prices
+
+
+def analyze_starter(account_data, state=None):
+    """
+    Build buy recommendations for an empty account from TICKERS plus GPT picks.
+
+    Starter prices/news and GPT suggestions are fetched concurrently, as in
+    analyze_holdings.
+    """
+    state = state if state is not None else new_state()
+    cash_balance = account_data.get("cash_balance", 0.0)
     headlines = {}
 
-    # -----------------------------
-    # Sell Recommendations
-    # -----------------------------
+    def buy(prices, gpt_suggestions, gpt_prices, starter_inputs, gpt_inputs, analytics):
+        all_prices = merge_prices(prices, gpt_prices)
+
+        # Collect positive candidates with clean news
+        candidates = collect_positive_candidates(
+            TICKERS,
+            headlines,
+            filter_negative_news=True,
+            verbose=True,
+            prices=all_prices,
+            state=state,
+            inputs=starter_inputs,
+        )
+
+        # Apply the same clean-news filter to GPT suggestions
+        gpt_candidates = collect_positive_candidates(
+            gpt_suggestions,
+            headlines,
+            filter_negative_news=True,
+            verbose=True,
+            prices=all_prices,
+            state=state,
+            inputs=gpt_inputs,
+        )
+        existing = set(t for t, _ in candidates)
+        for t, score in gpt_candidates:
+            if t not in existing:
+                candidates.append((t, score))
+                existing.add(t)
+
+        # Allocate cash using the shared helper
+        buy_recs = allocate_if_changed(
+            candidates, all_prices, cash_balance, headlines, state, analytics
+        )
+        return {
+            "buy": buy_recs,
+            "unallocated_cash": sector_capped_cash(
+                state["allocation"]["weights"], cash_balance
+            ),
+        }
+
+    stages = [
+        Stage("prices", lambda: get_prices(TICKERS), outputs=["prices"]),
+        Stage("analytics", lambda: update_analytics(TICKERS), outputs=["analytics"]),
+        Stage(
+            "gpt_suggestions",
+            lambda: get_gpt_suggestions(state, exclude=TICKERS, max_count=5),
+            outputs=["gpt_suggestions"],
+        ),
+        Stage(
+            "starter_inputs",
+            lambda prices: fetch_ticker_inputs(TICKERS, prices, state, with_news=True),
+            inputs=["prices"],
+            outputs=["starter_inputs"],
+        ),
+        Stage(
+            "gpt_prices",
+            lambda gpt_suggestions: get_prices(gpt_suggestions),
+            inputs=["gpt_suggestions"],
+            outputs=["gpt_prices"],
+        ),
+        Stage(
+            "gpt_inputs",
+            lambda gpt_suggestions, gpt_prices: fetch_ticker_inputs(
+                gpt_suggestions, gpt_prices, state, with_news=True
+            ),
+            inputs=["gpt_suggestions", "gpt_prices"],
+            outputs=["gpt_inputs"],
+        ),
+        Stage(
+            "buy",
+            buy,
+            inputs=[
+                "prices",
+                "gpt_suggestions",
+                "gpt_prices",
+                "starter_inputs",
+                "gpt_inputs",
+                "analytics",
+            ],
+            outputs=["buy", "unallocated_cash"],
+        ),
+    ]
+    get_index()  # load the symbol store before stages read it concurrently
+    values, state["pipeline"] = run_stages(stages)
+
+    recommendations = {
+        "buy": values["buy"],
+        "sell": [],
+        "unallocated_cash": values["unallocated_cash"],
+    }
+    prices = merge_prices(values["prices"], values["gpt_prices"])
+    return recommendations, headlines, prices
+
+
+def sell_recommendations(holdings, prices, inputs, stop_pcts=None):
+    """
+    Apply the sell rules to each holding.
+
+    prices: current prices {ticker: price}
+    inputs: per-ticker inputs from fetch_ticker_inputs
+    stop_pcts: optional per-ticker stop-loss % (e.g. volatility-scaled);
+        STOP_LOSS_PCT otherwise
+
+    Returns: list of sell recommendations
+    """
+    recommendations = []
     for h in holdings:
         ticker = h["ticker"]
         shares = h.get("shares", 0)
@@ -135,26 +528,28 @@ def analyze_holdings(account_data):
         avg_price = market_value / shares if shares else 0
         current_price = prices.get(ticker)
 
-        if current_price is None or avg_price == 0:
+        if current_price is None or avg_price == 0 or ticker not in inputs:
             continue
 
         change_pct = ((current_price - avg_price) / avg_price) * 100
-        headlines[ticker] = get_company_news(ticker)
-        perf = get_stock_performance(ticker, period="1mo")
+        perf_pct = inputs[ticker]["pct_change"]
+        stop_pct = (stop_pcts or {}).get(ticker, STOP_LOSS_PCT)
 
         # Sell rules
-        if change_pct <= -5:
-            recommendations["sell"].append(
+        if change_pct <= stop_pct:
+            recommendations.append(
                 {
                     "ticker": ticker,
                     "shares": shares,
-                    "reason": f"Down {change_pct:.2f}% from avg price",
+                    "reason": (
+                        f"Down {change_pct:.2f}% from avg price (stop {stop_pct:.2f}%)"
+                    ),
                 }
             )
             continue
 
-        if contains_negative_news(headlines.get(ticker, [])):
-            recommendations["sell"].append(
+        if inputs[ticker]["negative_news"]:
+            recommendations.append(
                 {
                     "ticker": ticker,
                     "shares": shares,
@@ -163,98 +558,50 @@ def analyze_holdings(account_data):
             )
             continue
 
-        if perf and perf["pct_change"] <= -5:
-            recommendations["sell"].append(
+        if perf_pct is not None and perf_pct <= -5:
+            recommendations.append(
                 {
                     "ticker": ticker,
                     "shares": shares,
-                    "reason": f"Down {perf['pct_change']:.2f}% over last month",
+                    "reason": f"Down {perf_pct:.2f}% over last month",
                 }
             )
             continue
 
-    # -----------------------------
-    # Buy Recommendations
-    # -----------------------------
-    positive_candidates = collect_positive_candidates(
-        tickers, headlines, filter_negative_news=False, verbose=False
-    )
-
-    # Ask GPT for additional high-performing tickers not already held
-    gpt_suggestions = suggest_high_performing_tickers(
-        preferred_universe=None, exclude=tickers, max_count=5
-    )
-    if gpt_suggestions:
-        gpt_prices = get_prices(gpt_suggestions)
-        if isinstance(gpt_prices, dict):
-            prices.update(gpt_prices)
-        gpt_candidates = collect_positive_candidates(
-            gpt_suggestions, headlines, filter_negative_news=False, verbose=False
-        )
-        positive_candidates.extend(gpt_candidates)
-
-    # Allocate cash proportionally to performance using the shared helper
-    buy_recs = allocate_cash_weighted_by_performance(
-        positive_candidates, prices, cash_balance, headlines
-    )
-    recommendations["buy"].extend(buy_recs)
-
-    # Fallback buy: QQQ if significant cash remains
-    if cash_balance > 500:
-        price = prices.get("QQQ")
-        if price and price > 0:
-            shares = round(cash_balance / price, 3)
-            if shares > 0:
-                recommendations["buy"].append(
-                    {
-                        "ticker": "QQQ",
-                        "shares": shares,
-                        "cost_usd": round(shares * price, 2),
-                        "reason": "Tech sector momentum placeholder",
-                    }
-                )
-
-    return recommendations, headlines, prices
-
+    return recommendations
 
-def analyze_starter(account_data):
-    cash_balance = account_data.get("cash_balance", 0.0)
-    headlines = {}
-    recommendations = {"buy": [], "sell": []}
 
-    prices = get_prices(TICKERS)
+def fetch_ticker_inputs(tickers, prices, state, with_news=False):
+    """
+    Refresh per-ticker inputs concurrently (see refresh_ticker_inputs).
 
-    # Collect positive candidates with clean news
-    candidates = collect_positive_candidates(
-        TICKERS, headlines, filter_negative_news=True, verbose=True
+    Returns: dict {ticker: inputs}
+    """
+    prices = prices or {}
+    return fan_out(
+        lambda ticker: refresh_ticker_inputs(
+            ticker, prices.get(ticker), state, with_news=with_news
+        ),
+        tickers or [],
     )
 
-    # Ask GPT for additional high-performing tickers and apply same clean-news filter
-    gpt_suggestions = suggest_high_performing_tickers(
-        preferred_universe=None, exclude=TICKERS, max_count=5
-    )
-    if gpt_suggestions:
-        gpt_prices = get_prices(gpt_suggestions)
-        if isinstance(gpt_prices, dict):
-            prices.update(gpt_prices)
-        gpt_candidates = collect_positive_candidates(
-            gpt_suggestions, headlines, filter_negative_news=True, verbose=True
-        )
-        existing = set(t for t, _ in candidates)
-        for t, score in gpt_candidates:
-            if t not in existing:
-                candidates.append((t, score))
-                existing.add(t)
-
-    # Allocate cash using the shared helper
-    recommendations["buy"] = allocate_cash_weighted_by_performance(
-        candidates, prices, cash_balance, headlines
-    )
 
-    return recommendations, headlines, prices
+def merge_prices(prices, extra_prices):
+    merged = dict(prices or {})
+    if isinstance(extra_prices, dict):
+        merged.update(extra_prices)
+    return merged
 
 
-def collect_positive_candidates(tickers, headlines, filter_negative_news=False, verbose=False):
+def collect_positive_candidates(
+    tickers,
+    headlines,
+    filter_negative_news=False,
+    verbose=False,
+    prices=None,
+    state=None,
+    inputs=None,
+):
     """
     Build a list of positive momentum candidates.
 
@@ -262,44 +609,72 @@ def collect_positive_candidates(tickers, headlines, filter_negative_news=False,
     headlines: dict to populate when fetching news
     filter_negative_news: whether to skip tickers with negative news
     verbose: whether to print skip reasons and headlines when filtering
+    prices: current prices {ticker: price}, used to detect changed inputs
+    state: advisor state; cached inputs are reused for unchanged tickers
+    inputs: optional prefetched {ticker: inputs} from fetch_ticker_inputs
 
     Returns: list of tuples (ticker, pct_change)
     """
+    prices = prices or {}
+    state = state if state is not None else new_state()
+    prefetched = inputs or {}
     candidates = []
     for ticker in tickers:
+        ticker_inputs = prefetched.get(ticker) or refresh_ticker_inputs(
+            ticker, prices.get(ticker), state, with_news=filter_negative_news
+        )
         if filter_negative_news:
-            raw_headlines = get_company_news(ticker)
-            headlines[ticker] = raw_headlines
-            titles = [h.get("title", "") for h in raw_headlines]
-            if contains_negative_news(titles):
+            headlines[ticker] = ticker_inputs["headlines"]
+            if ticker_inputs["negative_news"]:
                 if verbose:
                     print(f"Skipping {ticker} due to negative news")
-                    print_ticker_headlines(titles)
+                    print_ticker_headlines(ticker_inputs["headlines"])
                 continue
 
-        perf = get_stock_performance(ticker, period="1mo")
-        if perf and perf.get("pct_change", 0) > 0:
-            candidates.append((ticker, perf["pct_change"]))
+        pct_change = ticker_inputs["pct_change"]
+        if pct_change is not None and pct_change > 0:
+            candidates.append((ticker, pct_change))
 
     return candidates
 
 
-def allocate_cash_weighted_by_performance(candidates, prices, cash_balance, headlines):
+def allocation_weights(candidates, analytics=None):
+    """
+    Performance-proportional weights, reduced for correlated candidates and
+    capped per sector.
+
+    Returns: dict {ticker: weight}
+    """
+    total_score = sum(score for _, score in candidates)
+    if total_score == 0:
+        return {}
+
+    weights = diversify_weights(
+        {ticker: score / total_score for ticker, score in candidates}, analytics
+    )
+    return cap_sector_weights(weights, MAX_SECTOR_WEIGHT)
+
+
+def allocate_cash_weighted_by_performance(
+    candidates, prices, cash_balance, headlines, analytics=None, weights=None
+):
     """
     candidates: list of tuples (ticker, perf_score)
     prices: dict of current prices {ticker: price}
     cash_balance: float
     headlines: dict to store news {ticker: headlines_list}
+    analytics: optional snapshot from update_analytics; correlated
+        candidates get smaller weights
+    weights: optional precomputed allocation_weights(candidates, analytics)
 
     Returns: list of buy recommendations
     """
     recommendations = []
-    total_score = sum(score for _, score in candidates)
-    if total_score == 0:
-        return recommendations
+    if weights is None:
+        weights = allocation_weights(candidates, analytics)
 
     for ticker, score in candidates:
-        weight = score / total_score
+        weight = weights.get(ticker, 0.0)
         cash_for_stock = cash_balance * weight
         price = prices.get(ticker)
         if price and price > 0:
@@ -316,6 +691,43 @@ def allocate_cash_weighted_by_performance(candidates, prices, cash_balance, head
     return recommendations
 
 
+def cap_sector_weights(weights, max_sector_weight):
+    """
+    Scale down weights so no known sector exceeds max_sector_weight in total.
+
+    Cash freed by the cap is left unallocated and reported by
+    sector_capped_cash. Tickers missing from the symbol store ("Unknown"
+    sector) are not capped.
+    """
+    sector_totals = {}
+    for ticker, weight in weights.items():
+        sector = get_sector(ticker)
+        sector_totals[sector] = sector_totals.get(sector, 0.0) + weight
+
+    capped = {}
+    for ticker, weight in weights.items():
+        sector = get_sector(ticker)
+        total = sector_totals[sector]
+        if sector != "Unknown" and total > max_sector_weight:
+            weight *= max_sector_weight / total
+        capped[ticker] = weight
+    return capped
+
+
+def sector_capped_cash(weights, cash_balance):
+    """
+    Cash held back because cap_sector_weights scaled weights down.
+
+    weights: allocation_weights output (sums to 1 before the cap)
+    cash_balance: float
+
+    Returns: amount in USD, 0.0 when nothing was capped or nothing allocated
+    """
+    if not weights:
+        return 0.0
+    return round(cash_balance * max(1.0 - sum(weights.values()), 0.0), 2)
+
+
 # -----------------------------
 # Run Advisor
 # -----------------------------
@@ -328,8 +740,12 @@ def run_advisor():
     with open(JSON_FILE, "r", encoding="utf-8") as f:
         account_data = json.load(f)
 
-    # Analyze holdings and get recommendations
-    recommendations, headlines, prices = analyze_holdings(account_data)
+    # Analyze holdings, reusing signals from the previous run where inputs are unchanged
+    state = load_state(STATE_FILE)
+    recommendations, headlines, prices = analyze_holdings(account_data, state)
+    changes = diff_recommendations(state.get("recommendations"), recommendations)
+    state["recommendations"] = recommendations
+    save_state(state, STATE_FILE)
 
     # Log results with timestamped filename
     timestamp = datetime.datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
@@ -342,6 +758,9 @@ def run_advisor():
         "prices": prices,
         "headlines": headlines,
         "recommendations": recommendations,
+        "recomputed": state["recomputed"],
+        "changes": changes,
+        "pipeline": state["pipeline"],
     }
 
     with open(log_file, "w", encoding="utf-8") as f:
@@ -373,6 +792,15 @@ def run_advisor():
     else:
         print("\nNo buy recommendations.")
 
+    if recommendations.get("unallocated_cash"):
+        print(
+            f"\nLeft unallocated by the {MAX_SECTOR_WEIGHT:.0%} sector cap: "
+            f"${recommendations['unallocated_cash']:.2f}"
+        )
+
+    print_recommendation_changes(changes, state["recomputed"])
+    print_critical_path(state["pipeline"])
+
 
 # -----------------------------
 # Entry Point
@@ -0,0 +1,125 @@
+import datetime
+import hashlib
+import json
+
+
+# -----------------------------
+# Persisted Advisor State
+# -----------------------------
+def new_state():
+    return {
+        "tickers": {},
+        "gpt_suggestions": None,
+        "allocation": None,
+        "recommendations": None,
+        "recomputed": [],
+        "pipeline": None,
+    }
+
+
+def load_state(state_file):
+    """
+    Load the previous run's inputs and derived signals.
+
+    Returns a fresh state if the file is missing or unreadable.
+    """
+    if not state_file.exists():
+        return new_state()
+
+    try:
+        with open(state_file, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"Ignoring unreadable advisor state {state_file}: {e}")
+        return new_state()
+
+    state = new_state()
+    if isinstance(data, dict):
+        state.update({k: v for k, v in data.items() if k in state})
+    # Tickers re-evaluated and stage timings for the current run
+    state["recomputed"] = []
+    state["pipeline"] = None
+    return state
+
+
+def save_state(state, state_file):
+    with open(state_file, "w", encoding="utf-8") as f:
+        json.dump(state, f, indent=2)
+
+
+# -----------------------------
+# Change Detection
+# -----------------------------
+def now_iso():
+    return datetime.datetime.now(datetime.UTC).isoformat()
+
+
+def is_stale(timestamp, max_age_minutes):
+    if not timestamp:
+        return True
+    try:
+        checked = datetime.datetime.fromisoformat(timestamp)
+    except ValueError:
+        return True
+    age = datetime.datetime.now(datetime.UTC) - checked
+    return age > datetime.timedelta(minutes=max_age_minutes)
+
+
+def pct_moved(previous, current, tolerance_pct):
+    """True if current differs from previous by more than tolerance_pct percent."""
+    if previous is None or current is None:
+        return previous != current
+    if previous == 0:
+        return current != 0
+    return abs(current - previous) / abs(previous) * 100 > tolerance_pct
+
+
+def points_moved(previous, current, tolerance):
+    """True if two percentage values differ by more than tolerance points."""
+    if previous is None or current is None:
+        return previous != current
+    return abs(current - previous) > tolerance
+
+
+def headline_fingerprint(headlines):
+    """Stable hash of headline titles, independent of feed ordering."""
+    titles = sorted(
+        h.get("title", "") if isinstance(h, dict) else str(h) for h in headlines
+    )
+    return hashlib.sha1("\n".join(titles).encode("utf-8")).hexdigest()
+
+
+# -----------------------------
+# Recommendation Diff
+# -----------------------------
+def diff_recommendations(previous, current):
+    """
+    Compare two recommendation dicts ({"buy": [...], "sell": [...]}).
+
+    Returns: dict with "added", "removed" and "changed" lists, each entry
+    tagged with its "action" (buy/sell).
+    """
+    diff = {"added": [], "removed": [], "changed": []}
+    previous = previous or {}
+
+    for action in ("buy", "sell"):
+        before = {r["ticker"]: r for r in previous.get(action, [])}
+        after = {r["ticker"]: r for r in current.get(action, [])}
+
+        for ticker, rec in after.items():
+            if ticker not in before:
+                diff["added"].append({"action": action, **rec})
+            elif before[ticker] != rec:
+                diff["changed"].append(
+                    {
+                        "action": action,
+                        "ticker": ticker,
+                        "before": before[ticker],
+                        "after": rec,
+                    }
+                )
+        for ticker, rec in before.items():
+            if ticker not in after:
+                diff["removed"].append({"action": action, **rec})
+
+    return diff
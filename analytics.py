@@ -0,0 +1,290 @@
+import datetime
+import os
+import zipfile
+
+import numpy as np
+
+from fetch_prices import get_daily_closes
+from symbols import tradable_symbols
+from config import (
+    ANALYTICS_FILE,
+    ANALYTICS_WINDOW_DAYS,
+    BENCHMARK_TICKER,
+    STOP_LOSS_PCT,
+    STOP_VOL_MULTIPLIER,
+    STOP_HORIZON_DAYS,
+    MIN_STOP_LOSS_PCT,
+    MAX_STOP_LOSS_PCT,
+    CORRELATION_PENALTY,
+)
+
+TRADING_DAYS = 252
+
+
+# -----------------------------
+# Rolling Return Statistics
+# -----------------------------
+class RollingStats:
+    """
+    Rolling window of daily log returns for a fixed universe of tickers.
+
+    Running sums of returns and of their outer products are kept alongside a
+    ring buffer, so adding a bar is O(n^2) in the number of tickers instead of
+    recomputing over the whole window. The sums are rebuilt from the buffer
+    once per full window to stop floating-point drift.
+    """
+
+    def __init__(self, tickers, window=ANALYTICS_WINDOW_DAYS):
+        self.tickers = list(tickers)
+        self.index = {t: i for i, t in enumerate(self.tickers)}
+        self.window = window
+        n = len(self.tickers)
+        self.returns = np.zeros((window, n))
+        self.count = 0  # bars in the buffer, up to window
+        self.pos = 0  # next slot to write
+        self.updates = 0
+        self.sum = np.zeros(n)
+        self.cross = np.zeros((n, n))
+        self.last_prices = np.full(n, np.nan)
+        self.last_date = None  # date of the newest bar in the window
+        self.checked_on = None  # day bars were last fetched
+
+    def add_bar(self, date, prices):
+        """
+        Add one daily close per ticker.
+
+        prices: array of closes in self.tickers order; NaN carries the
+        previous close forward (a zero return).
+        """
+        prices = np.asarray(prices, dtype=float)
+        prices = np.where(np.isnan(prices), self.last_prices, prices)
+
+        if not np.isnan(self.last_prices).all():
+            r = np.log(prices / self.last_prices)
+            r = np.where(np.isfinite(r), r, 0.0)
+
+            if self.count == self.window:
+                old = self.returns[self.pos]
+                self.sum -= old
+                self.cross -= np.outer(old, old)
+            else:
+                self.count += 1
+
+            self.returns[self.pos] = r
+            self.sum += r
+            self.cross += np.outer(r, r)
+            self.pos = (self.pos + 1) % self.window
+
+            self.updates += 1
+            if self.updates % self.window == 0:
+                self._rebuild_sums()
+
+        self.last_prices = prices
+        self.last_date = date
+
+    def _rebuild_sums(self):
+        filled = self.returns[: self.count]
+        self.sum = filled.sum(axis=0)
+        self.cross = filled.T @ filled
+
+    def covariance(self):
+        """Sample covariance of daily log returns over the window."""
+        n = self.count
+        if n < 2:
+            return np.full((len(self.tickers),) * 2, np.nan)
+        return (self.cross - np.outer(self.sum, self.sum) / n) / (n - 1)
+
+    def snapshot(self):
+        """
+        Annualized volatility, beta to BENCHMARK_TICKER and correlation matrix.
+
+        Returns: dict with as_of, tickers, volatility {ticker: vol},
+        beta {ticker: beta} and correlation (numpy matrix in tickers order)
+        """
+        cov = self.covariance()
+        var = np.clip(np.diag(cov), 0.0, None)
+        std = np.sqrt(var)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            corr = cov / np.outer(std, std)
+
+        beta = {}
+        b = self.index.get(BENCHMARK_TICKER)
+        if b is not None and var[b] > 0:
+            beta = {t: float(cov[i, b] / var[b]) for t, i in self.index.items()}
+
+        return {
+            "as_of": self.last_date,
+            "tickers": self.tickers,
+            "volatility": {
+                t: float(std[i] * np.sqrt(TRADING_DAYS))
+                for t, i in self.index.items()
+                if np.isfinite(std[i])
+            },
+            "beta": beta,
+            "correlation": corr,
+        }
+
+
+# -----------------------------
+# Persistence
+# -----------------------------
+def save_stats(stats, path=ANALYTICS_FILE):
+    """
+    Save rolling statistics for load_stats.
+
+    Writes to a temp file and swaps it into place, so an interrupted save
+    never leaves a truncated state file behind.
+    """
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "wb") as f:
+        np.savez(
+            f,
+            tickers=np.array(stats.tickers),
+            window=stats.window,
+            returns=stats.returns,
+            count=stats.count,
+            pos=stats.pos,
+            updates=stats.updates,
+            sum=stats.sum,
+            cross=stats.cross,
+            last_prices=stats.last_prices,
+            last_date=np.array(stats.last_date or ""),
+            checked_on=np.array(stats.checked_on or ""),
+        )
+    os.replace(tmp_path, path)
+
+
+def load_stats(path=ANALYTICS_FILE):
+    """
+    Restore rolling statistics saved by save_stats, including the running
+    sums, so loading does not rescan the window.
+
+    Returns None if the file is missing, corrupt or from an older format.
+    """
+    if not path.exists():
+        return None
+    try:
+        with np.load(path) as data:
+            stats = RollingStats([str(t) for t in data["tickers"]], int(data["window"]))
+            stats.returns = data["returns"]
+            stats.count = int(data["count"])
+            stats.pos = int(data["pos"])
+            stats.updates = int(data["updates"])
+            stats.sum = data["sum"]
+            stats.cross = data["cross"]
+            stats.last_prices = data["last_prices"]
+            stats.last_date = str(data["last_date"]) or None
+            if "checked_on" in data.files:
+                stats.checked_on = str(data["checked_on"]) or None
+    except (OSError, ValueError, KeyError, EOFError, zipfile.BadZipFile) as e:
+        print(f"Ignoring unreadable analytics state {path}: {e}")
+        return None
+
+    return stats
+
+
+# -----------------------------
+# Daily Bar Updates
+# -----------------------------
+def update_analytics(tickers, path=ANALYTICS_FILE):
+    """
+    Bring the rolling statistics up to date and return a snapshot.
+
+    The universe is every tradable symbol in the store plus tickers, so
+    changing GPT picks does not change it. Bars are fetched at most once a
+    day, and only those newer than the stored state are added, on
+    BENCHMARK_TICKER's trading days; the window is rebuilt from history when
+    the universe changes.
+    """
+    universe = sorted(set(tickers) | set(tradable_symbols()) | {BENCHMARK_TICKER})
+    today = datetime.date.today().isoformat()
+    yesterday = (datetime.date.today() - datetime.timedelta(days=1)).isoformat()
+    stats = load_stats(path)
+
+    if (
+        stats is None
+        or stats.tickers != universe
+        or stats.window != ANALYTICS_WINDOW_DAYS
+    ):
+        stats = RollingStats(universe)
+        dates, closes = get_daily_closes(universe)
+    elif stats.checked_on == today:
+        # Completed bars only change once a day; weekends and holidays would
+        # otherwise refetch on every run since last_date lags yesterday.
+        return stats.snapshot()
+    else:
+        dates, closes = get_daily_closes(universe, start=stats.last_date)
+
+    benchmark = stats.index[BENCHMARK_TICKER]
+    for date, row in zip(dates, closes):
+        # Skip bars already in the window; today's bar is still forming
+        if (stats.last_date and date <= stats.last_date) or date > yesterday:
+            continue
+        # Stay on the benchmark's trading calendar: crypto trades on weekends
+        # and holidays, which would otherwise add zero-return equity rows.
+        # Crypto moves over those days fold into the next trading-day return.
+        if np.isnan(row[benchmark]):
+            continue
+        stats.add_bar(date, row)
+
+    stats.checked_on = today
+    save_stats(stats, path)
+    return stats.snapshot()
+
+
+# -----------------------------
+# Advisor Signals
+# -----------------------------
+def volatility_stop_pcts(analytics, tickers):
+    """
+    Per-ticker stop-loss thresholds (negative %) scaled by volatility.
+
+    The stop sits STOP_VOL_MULTIPLIER standard deviations of a
+    STOP_HORIZON_DAYS move below the average price, clamped between
+    MIN_STOP_LOSS_PCT and MAX_STOP_LOSS_PCT. Tickers without enough history
+    fall back to STOP_LOSS_PCT.
+    """
+    vols = (analytics or {}).get("volatility", {})
+    stops = {}
+    for ticker in tickers:
+        vol = vols.get(ticker)
+        if not vol:
+            stops[ticker] = STOP_LOSS_PCT
+            continue
+        move_pct = (
+            STOP_VOL_MULTIPLIER * vol * np.sqrt(STOP_HORIZON_DAYS / TRADING_DAYS) * 100
+        )
+        stops[ticker] = -float(np.clip(move_pct, MIN_STOP_LOSS_PCT, MAX_STOP_LOSS_PCT))
+    return stops
+
+
+def diversify_weights(weights, analytics):
+    """
+    Down-weight tickers that move together with the rest of the candidates.
+
+    Each weight is divided by 1 + CORRELATION_PENALTY * (mean positive
+    correlation with the other candidates), then renormalized. Tickers
+    missing from the analytics are left as they are.
+    """
+    if not analytics or len(weights) < 2:
+        return weights
+
+    index = {t: i for i, t in enumerate(analytics["tickers"])}
+    known = [t for t in weights if t in index]
+    if len(known) < 2:
+        return weights
+
+    idx = [index[t] for t in known]
+    corr = np.nan_to_num(analytics["correlation"][np.ix_(idx, idx)])
+    np.fill_diagonal(corr, 0.0)
+    crowding = np.clip(corr, 0.0, None).sum(axis=1) / (len(known) - 1)
+
+    adjusted = dict(weights)
+    for t, c in zip(known, crowding):
+        adjusted[t] = weights[t] / (1 + CORRELATION_PENALTY * float(c))
+
+    total = sum(adjusted.values())
+    if total == 0:
+        return weights
+    scale = sum(weights.values()) / total
+    return {t: w * scale for t, w in adjusted.items()}
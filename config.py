@@ -7,50 +7,44 @@ load_dotenv()  # loads .env file if present
 CSV_FILE = Path("data/schwab_holdings.csv")
 JSON_FILE = Path("account.json")
 LOGS_DIR = Path("logs")
+STATE_FILE = Path("advisor_state.json")
+SYMBOLS_CSV = Path("data/symbols.csv")
+SYMBOLS_DB = Path("data/symbols.db")
+ANALYTICS_FILE = Path("analytics_state.npz")
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 
-# TICKERS = ["VOO", "VTI", "AAPLE", "GOOGL", "AAPL", "NVDA", "AMZN", "MSFT"]
+# Sell when price falls this far (%) below a holding's average price
+STOP_LOSS_PCT = -5
+
+# Volatility-scaled stops: STOP_VOL_MULTIPLIER standard deviations of a
+# STOP_HORIZON_DAYS move, clamped to [MIN_STOP_LOSS_PCT, MAX_STOP_LOSS_PCT].
+# STOP_LOSS_PCT is the fallback for tickers without enough history.
+STOP_VOL_MULTIPLIER = 2.0
+STOP_HORIZON_DAYS = 5
+MIN_STOP_LOSS_PCT = 3.0
+MAX_STOP_LOSS_PCT = 15.0
+
+# Rolling volatility / beta / correlation analytics
+ANALYTICS_WINDOW_DAYS = 63
+BENCHMARK_TICKER = "SPY"
+# How strongly buy weights are reduced for candidates correlated with each other
+CORRELATION_PENALTY = 1.0
+
+# Incremental recomputation: a ticker is only re-evaluated when its price moves
+# more than PRICE_TOLERANCE_PCT or its cached inputs are older than
+# INPUT_MAX_AGE_MINUTES. Refreshed 1mo performance within PERF_TOLERANCE_PCT
+# points (and unchanged headlines) keeps the previous signals.
+PRICE_TOLERANCE_PCT = 0.5
+PERF_TOLERANCE_PCT = 0.5
+INPUT_MAX_AGE_MINUTES = 60
+GPT_SUGGESTION_TTL_MINUTES = 240
+
+# Concurrent stages / per-ticker fetches in the advisor pipeline
+PIPELINE_MAX_WORKERS = 8
+
+# Max share of buy cash allocated to a single sector (see data/symbols.csv)
+MAX_SECTOR_WEIGHT = 0.5
+# Lowest liquidity tier accepted for GPT-suggested tickers: low, medium or high
+MIN_SUGGESTION_LIQUIDITY = "medium"
 
 TICKERS = ["AAPL", "MSFT", "NVDA", "AMZN", "AMD"]
-NEW_TICKERS = [
-    # Technology
-    "AAPL",  # Apple
-    "MSFT",  # Microsoft
-    "NVDA",  # Nvidia
-    "GOOGL",  # Alphabet
-    # Financials
-    "JPM",  # JPMorgan Chase
-    # "BRK.B",  # Berkshire Hathaway
-    "V",  # Visa
-    # Healthcare
-    "JNJ",  # Johnson & Johnson
-    "PFE",  # Pfizer
-    "UNH",  # UnitedHealth
-    # Consumer Discretionary
-    "AMZN",  # Amazon
-    "TSLA",  # Tesla
-    "HD",  # Home Depot
-    # Consumer Staples
-    "PG",  # Procter & Gamble
-    "KO",  # Coca-Cola
-    "PEP",  # PepsiCo
-    # Energy
-    "XOM",  # Exxon Mobil
-    "CVX",  # Chevron
-    # Industrials
-    "BA",  # Boeing
-    "CAT",  # Caterpillar
-    # Other / Diversifiers
-    "GLD",  # SPDR Gold Trust (gold ETF)
-    "BTC-USD",  # Bitcoin (USD)
-    "SPY",  # S&P 500 ETF
-    "VOO",
-    "VTI",
-    # ETF / Index Funds
-    # "VOO",
-    # "VTI",
-    # "QQQ",
-    # "XLF",
-    # "XLK",
-    # "XLE",
-]
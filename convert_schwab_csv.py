@@ -3,6 +3,8 @@ import json
 from datetime import datetime
 from pathlib import Path
 
+from symbols import is_cash_symbol
+
 
 # Input & output paths
 CSV_FILE = Path("data/schwab_holdings.csv")
@@ -33,7 +35,7 @@ def convert_csv_to_json(csv_file, json_file):
 
             # Schwab sometimes lists "Cash & Cash Investments" as a pseudo-symbol
             if (
-                "CASH" in symbol.upper()
+                is_cash_symbol(symbol)
                 or "MONEY MARKET" in row.get("Description", "").upper()
             ):
                 cash_balance += market_value
@@ -1,15 +1,26 @@
+import threading
+
 import yfinance as yf
 
 
+# yf.download resets module-level result buffers on every call, so concurrent
+# downloads (e.g. from advisor pipeline stages) can clobber each other.
+_download_lock = threading.Lock()
+
+
+def download(**kwargs):
+    """yf.download, serialized across threads."""
+    with _download_lock:
+        return yf.download(**kwargs)
+
+
 def get_prices(tickers):
     prices = {}
     if not tickers:
         return prices
 
     try:
-        data = yf.download(tickers=tickers, period="1d", interval="1m")["Close"].iloc[
-            -1
-        ]
+        data = download(tickers=tickers, period="1d", interval="1m")["Close"].iloc[-1]
         for ticker in tickers:
             prices[ticker] = float(data[ticker]) if ticker in data else None
     except Exception as e:
@@ -68,6 +79,29 @@ def get_stock_performance(ticker, period="1mo"):
     }
 
 
+def get_daily_closes(tickers, start=None):
+    """
+    Daily closes for several tickers.
+
+    start: ISO date to fetch from; defaults to the last 2 years
+
+    Returns: (dates, closes) where dates are ISO strings and closes is an
+    array with one row per date and columns in tickers order (NaN if missing)
+    """
+    kwargs = {"start": start} if start else {"period": "2y"}
+    try:
+        close = download(tickers=tickers, interval="1d", progress=False, **kwargs)[
+            "Close"
+        ]
+    except Exception as e:
+        print(f"Error fetching daily bars: {e}")
+        return [], []
+
+    close = close.reindex(columns=tickers)
+    dates = [d.date().isoformat() for d in close.index]
+    return dates, close.to_numpy(dtype=float)
+
+
 if __name__ == "__main__":
     from config import TICKERS
 
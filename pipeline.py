@@ -0,0 +1,170 @@
+import time
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+
+from config import PIPELINE_MAX_WORKERS
+
+
+# -----------------------------
+# Stage Graph
+# -----------------------------
+@dataclass
+class Stage:
+    """
+    One step of a pipeline.
+
+    func is called with the declared inputs as keyword arguments. A stage with
+    one output returns its value directly; otherwise it returns a dict keyed
+    by output name.
+    """
+
+    name: str
+    func: Callable
+    inputs: list = field(default_factory=list)
+    outputs: list = field(default_factory=list)
+
+
+def resolve_dependencies(stages, initial=None):
+    """
+    Map each stage to the stages producing its inputs.
+
+    Raises ValueError for duplicate outputs, missing inputs or cycles.
+    """
+    available = set(initial or {})
+    producers = {}
+    for stage in stages:
+        for output in stage.outputs:
+            if output in producers or output in available:
+                raise ValueError(f"Output '{output}' is produced more than once")
+            producers[output] = stage.name
+
+    depends_on = {}
+    for stage in stages:
+        deps = set()
+        for name in stage.inputs:
+            if name in producers:
+                deps.add(producers[name])
+            elif name not in available:
+                raise ValueError(f"Stage '{stage.name}' needs unknown input '{name}'")
+        depends_on[stage.name] = deps
+
+    # Kahn's algorithm, only to reject cycles up front
+    remaining = {name: set(deps) for name, deps in depends_on.items()}
+    while remaining:
+        ready = [name for name, deps in remaining.items() if not deps]
+        if not ready:
+            raise ValueError(f"Cycle between stages: {', '.join(sorted(remaining))}")
+        for name in ready:
+            del remaining[name]
+        for deps in remaining.values():
+            deps.difference_update(ready)
+
+    return depends_on
+
+
+# -----------------------------
+# Scheduler
+# -----------------------------
+def run_stages(stages, initial=None, max_workers=PIPELINE_MAX_WORKERS):
+    """
+    Run stages concurrently, starting each as soon as its inputs are ready.
+
+    stages: list of Stage
+    initial: dict of values available before any stage runs
+
+    Returns: (values, report) where values holds every input and output and
+    report is built by critical_path_report
+    """
+    depends_on = resolve_dependencies(stages, initial)
+    by_name = {stage.name: stage for stage in stages}
+    values = dict(initial or {})
+    timings = {}
+    done = set()
+    running = {}
+
+    run_start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        while len(done) < len(stages):
+            for name, deps in depends_on.items():
+                if name in done or name in running.values() or not deps <= done:
+                    continue
+                stage = by_name[name]
+                kwargs = {key: values[key] for key in stage.inputs}
+                future = pool.submit(_timed_call, stage.func, kwargs)
+                running[future] = name
+
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                name = running.pop(future)
+                stage = by_name[name]
+                result, started, ended = future.result()
+                if len(stage.outputs) == 1:
+                    result = {stage.outputs[0]: result}
+                for output in stage.outputs:
+                    values[output] = result.get(output)
+                timings[name] = (started - run_start, ended - run_start)
+                done.add(name)
+
+    total = time.perf_counter() - run_start
+    return values, critical_path_report(depends_on, timings, total)
+
+
+def _timed_call(func, kwargs):
+    started = time.perf_counter()
+    result = func(**kwargs)
+    return result, started, time.perf_counter()
+
+
+def fan_out(func, items, max_workers=PIPELINE_MAX_WORKERS):
+    """
+    Apply func to every item concurrently, for per-ticker I/O inside a stage.
+
+    Returns: dict {item: func(item)}
+    """
+    items = list(items)
+    if not items:
+        return {}
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as pool:
+        return dict(zip(items, pool.map(func, items)))
+
+
+# -----------------------------
+# Reporting
+# -----------------------------
+def critical_path_report(depends_on, timings, total_seconds):
+    """
+    Find the dependency chain that determined end-to-end latency.
+
+    Walks back from the last stage to finish, each time following the
+    dependency that finished last (the one the stage was waiting on).
+
+    Returns: dict with total_seconds, critical_path (list of
+    {"stage", "seconds"}) and per-stage timings
+    """
+    path = []
+    if timings:
+        name = max(timings, key=lambda n: timings[n][1])
+        while name is not None:
+            started, ended = timings[name]
+            path.append({"stage": name, "seconds": round(ended - started, 3)})
+            deps = depends_on[name]
+            name = max(deps, key=lambda n: timings[n][1]) if deps else None
+        path.reverse()
+
+    return {
+        "total_seconds": round(total_seconds, 3),
+        "critical_path": path,
+        "stages": {
+            name: {"start": round(s, 3), "end": round(e, 3)}
+            for name, (s, e) in sorted(timings.items(), key=lambda kv: kv[1][0])
+        },
+    }
+
+
+def print_critical_path(report):
+    chain = " → ".join(
+        f"{step['stage']} ({step['seconds']:.2f}s)" for step in report["critical_path"]
+    )
+    print(f"\nPipeline finished in {report['total_seconds']:.2f}s")
+    print(f"Critical path: {chain or 'none'}")
@@ -0,0 +1,159 @@
+import csv
+import os
+import sqlite3
+import tempfile
+import threading
+
+from config import SYMBOLS_CSV, SYMBOLS_DB
+
+
+FIELDS = ["symbol", "name", "sector", "asset_class", "exchange", "liquidity"]
+LIQUIDITY_RANK = {"low": 0, "medium": 1, "high": 2}
+
+# In-memory index, loaded once per process from the SQLite store. Pipeline
+# stages can reach it from several threads at once, so the first load is locked.
+_index = None
+_index_lock = threading.Lock()
+
+
+# -----------------------------
+# SQLite Store
+# -----------------------------
+def build_symbol_db(csv_file, db_file):
+    """
+    (Re)build the SQLite symbol store from the seed CSV.
+
+    Rows missing a symbol, or with an unknown liquidity tier, are skipped.
+    The store is built in a temp file and swapped into place, so readers
+    never see a half-built table.
+    """
+    rows = []
+    with open(csv_file, newline="", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            symbol = (row.get("symbol") or "").strip().upper()
+            liquidity = (row.get("liquidity") or "").strip().lower()
+            if not symbol or liquidity not in LIQUIDITY_RANK:
+                print(f"Skipping invalid symbol metadata row: {row}")
+                continue
+            rows.append(
+                (
+                    symbol,
+                    row.get("name", "").strip(),
+                    row.get("sector", "").strip(),
+                    row.get("asset_class", "").strip().lower(),
+                    row.get("exchange", "").strip(),
+                    liquidity,
+                )
+            )
+
+    fd, tmp_file = tempfile.mkstemp(
+        prefix=db_file.name + ".", suffix=".tmp", dir=db_file.parent
+    )
+    os.close(fd)
+    with sqlite3.connect(tmp_file) as conn:
+        conn.execute(
+            "CREATE TABLE symbols ("
+            "symbol TEXT PRIMARY KEY, name TEXT, sector TEXT, "
+            "asset_class TEXT, exchange TEXT, liquidity TEXT)"
+        )
+        conn.execute("CREATE INDEX idx_symbols_sector ON symbols (sector)")
+        conn.executemany(
+            "INSERT OR REPLACE INTO symbols VALUES (?, ?, ?, ?, ?, ?)", rows
+        )
+    conn.close()
+    os.replace(tmp_file, db_file)
+
+    print(f"✅ Built symbol store {db_file} ({len(rows)} symbols)")
+
+
+def load_symbols(db_file=None, csv_file=None):
+    """
+    Load the symbol store into an in-memory index keyed by symbol.
+
+    db_file / csv_file default to config's SYMBOLS_DB / SYMBOLS_CSV.
+    The SQLite file is rebuilt from the seed CSV when missing or older than it.
+    Returns: dict {symbol: metadata_dict}
+    """
+    db_file = db_file or SYMBOLS_DB
+    csv_file = csv_file or SYMBOLS_CSV
+    if csv_file.exists() and (
+        not db_file.exists() or db_file.stat().st_mtime < csv_file.stat().st_mtime
+    ):
+        build_symbol_db(csv_file, db_file)
+
+    if not db_file.exists():
+        raise FileNotFoundError(f"Symbol store not found: {db_file}")
+
+    conn = sqlite3.connect(db_file)
+    try:
+        rows = conn.execute(f"SELECT {', '.join(FIELDS)} FROM symbols").fetchall()
+    finally:
+        conn.close()
+
+    return {row[0]: dict(zip(FIELDS, row)) for row in rows}
+
+
+def get_index():
+    global _index
+    if _index is None:
+        with _index_lock:
+            if _index is None:
+                _index = load_symbols()
+    return _index
+
+
+# -----------------------------
+# Lookups
+# -----------------------------
+def get_symbol(symbol):
+    """Return the metadata dict for symbol, or None if unknown."""
+    return get_index().get(symbol.strip().upper())
+
+
+def get_sector(symbol):
+    meta = get_symbol(symbol)
+    return meta["sector"] if meta else "Unknown"
+
+
+def is_cash_symbol(symbol):
+    meta = get_symbol(symbol)
+    return meta is not None and meta["asset_class"] == "cash"
+
+
+def tradable_symbols(min_liquidity="low"):
+    """All non-cash symbols in the store with at least min_liquidity."""
+    min_rank = LIQUIDITY_RANK[min_liquidity]
+    return [
+        s
+        for s, meta in get_index().items()
+        if meta["asset_class"] != "cash"
+        and LIQUIDITY_RANK[meta["liquidity"]] >= min_rank
+    ]
+
+
+def validate_symbols(symbols, min_liquidity="low"):
+    """
+    Split symbols into known, tradable ones and rejects, without any network call.
+
+    symbols: list of ticker strings
+    min_liquidity: lowest liquidity tier to accept ("low", "medium", "high")
+
+    Returns: (valid, rejected) lists, valid symbols normalized to uppercase
+    """
+    min_rank = LIQUIDITY_RANK[min_liquidity]
+    valid, rejected = [], []
+    for symbol in symbols:
+        meta = get_symbol(symbol)
+        if (
+            meta is None
+            or meta["asset_class"] == "cash"
+            or LIQUIDITY_RANK[meta["liquidity"]] < min_rank
+        ):
+            rejected.append(symbol)
+        else:
+            valid.append(meta["symbol"])
+    return valid, rejected
+
+
+if __name__ == "__main__":
+    build_symbol_db(SYMBOLS_CSV, SYMBOLS_DB)
@@ -0,0 +1,16 @@
+import os
+
+import pytest
+
+# analyze.py builds an OpenAI client at import time; tests never call it
+os.environ.setdefault("OPENAI_API_KEY", "test-key")
+
+import symbols  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def symbol_store(tmp_path, monkeypatch):
+    """Build the symbol store under tmp_path instead of data/symbols.db."""
+    monkeypatch.setattr(symbols, "SYMBOLS_DB", tmp_path / "symbols.db")
+    monkeypatch.setattr(symbols, "_index", None)
+    return tmp_path / "symbols.db"
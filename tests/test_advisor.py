@@ -0,0 +1,119 @@
+import datetime
+
+import pytest
+
+import advisor
+from advisor_state import new_state
+
+
+@pytest.fixture
+def fetchers(monkeypatch):
+    """Stub news/performance fetchers; counts calls and serves set values."""
+    calls = {"news": 0, "perf": 0}
+    data = {"pct_change": 4.0, "titles": ["AAPL rises"]}
+
+    def get_stock_performance(ticker, period="1mo"):
+        calls["perf"] += 1
+        return {"pct_change": data["pct_change"], "start_price": 1, "end_price": 1}
+
+    def get_company_news(ticker, max_items=3):
+        calls["news"] += 1
+        return [{"title": t, "link": ""} for t in data["titles"]]
+
+    monkeypatch.setattr(advisor, "get_stock_performance", get_stock_performance)
+    monkeypatch.setattr(advisor, "get_company_news", get_company_news)
+    return calls, data
+
+
+def test_refresh_reuses_inputs_when_quiet(fetchers):
+    calls, _ = fetchers
+    state = new_state()
+
+    first = advisor.refresh_ticker_inputs("AAPL", 200.0, state, with_news=True)
+    again = advisor.refresh_ticker_inputs("AAPL", 200.5, state, with_news=True)
+
+    assert again is first
+    assert calls == {"news": 1, "perf": 1}
+    assert state["recomputed"] == ["AAPL"]
+
+
+def test_refresh_keeps_signals_when_refetched_inputs_within_tolerance(fetchers):
+    calls, data = fetchers
+    state = new_state()
+    first = advisor.refresh_ticker_inputs("AAPL", 200.0, state, with_news=True)
+
+    data["pct_change"] = 4.3
+    again = advisor.refresh_ticker_inputs("AAPL", 210.0, state, with_news=True)
+
+    assert calls == {"news": 2, "perf": 2}
+    assert again is first
+    assert again["pct_change"] == 4.0
+    assert again["price"] == 210.0
+    assert state["recomputed"] == ["AAPL"]
+
+
+def test_refresh_recomputes_on_new_headlines(fetchers):
+    _, data = fetchers
+    state = new_state()
+    advisor.refresh_ticker_inputs("AAPL", 200.0, state, with_news=True)
+
+    data["titles"] = ["AAPL faces lawsuit"]
+    entry = advisor.refresh_ticker_inputs("AAPL", 210.0, state, with_news=True)
+
+    assert entry["negative_news"]
+    assert state["recomputed"] == ["AAPL", "AAPL"]
+
+
+def test_refresh_refetches_stale_inputs(fetchers):
+    calls, _ = fetchers
+    state = new_state()
+    entry = advisor.refresh_ticker_inputs("AAPL", 200.0, state)
+    entry["checked_at"] = (
+        datetime.datetime.now(datetime.UTC) - datetime.timedelta(days=1)
+    ).isoformat()
+
+    advisor.refresh_ticker_inputs("AAPL", 200.0, state)
+
+    assert calls["perf"] == 2
+    assert calls["news"] == 0
+
+
+def test_refresh_fetches_news_when_cached_entry_lacks_it(fetchers):
+    calls, _ = fetchers
+    state = new_state()
+    advisor.refresh_ticker_inputs("AAPL", 200.0, state)
+
+    entry = advisor.refresh_ticker_inputs("AAPL", 200.0, state, with_news=True)
+
+    assert calls["news"] == 1
+    assert entry["headline_fp"] is not None
+
+
+def test_allocation_reuses_weights_but_prices_shares_live():
+    state = new_state()
+    candidates = [("AAPL", 4.0), ("XOM", 2.0)]
+
+    first = advisor.allocate_if_changed(
+        candidates, {"AAPL": 200.0, "XOM": 100.0}, 1000.0, {}, state
+    )
+    cached = state["allocation"]
+    second = advisor.allocate_if_changed(
+        candidates, {"AAPL": 100.0, "XOM": 100.0}, 1000.0, {}, state
+    )
+
+    assert state["allocation"] is cached
+    assert {r["ticker"]: r["shares"] for r in first}["AAPL"] == 2.5
+    assert {r["ticker"]: r["shares"] for r in second}["AAPL"] == 5.0
+
+
+def test_allocation_recomputes_weights_when_config_changes(monkeypatch):
+    state = new_state()
+    candidates = [("AAPL", 4.0), ("MSFT", 4.0)]
+    prices = {"AAPL": 100.0, "MSFT": 100.0}
+
+    capped = advisor.allocate_if_changed(candidates, prices, 1000.0, {}, state)
+    monkeypatch.setattr(advisor, "MAX_SECTOR_WEIGHT", 1.0)
+    uncapped = advisor.allocate_if_changed(candidates, prices, 1000.0, {}, state)
+
+    assert sum(r["cost_usd"] for r in capped) == pytest.approx(500.0)
+    assert sum(r["cost_usd"] for r in uncapped) == pytest.approx(1000.0)
@@ -0,0 +1,102 @@
+import datetime
+
+from advisor_state import (
+    diff_recommendations,
+    headline_fingerprint,
+    is_stale,
+    load_state,
+    new_state,
+    pct_moved,
+    points_moved,
+    save_state,
+)
+
+
+def test_diff_recommendations_added_removed_changed():
+    previous = {
+        "buy": [
+            {"ticker": "AAPL", "shares": 1.0},
+            {"ticker": "MSFT", "shares": 2.0},
+        ],
+        "sell": [{"ticker": "XOM", "shares": 3}],
+    }
+    current = {
+        "buy": [
+            {"ticker": "AAPL", "shares": 1.0},
+            {"ticker": "MSFT", "shares": 1.5},
+            {"ticker": "NVDA", "shares": 0.5},
+        ],
+        "sell": [],
+    }
+
+    diff = diff_recommendations(previous, current)
+
+    assert diff["added"] == [{"action": "buy", "ticker": "NVDA", "shares": 0.5}]
+    assert diff["removed"] == [{"action": "sell", "ticker": "XOM", "shares": 3}]
+    assert diff["changed"] == [
+        {
+            "action": "buy",
+            "ticker": "MSFT",
+            "before": {"ticker": "MSFT", "shares": 2.0},
+            "after": {"ticker": "MSFT", "shares": 1.5},
+        }
+    ]
+
+
+def test_diff_against_no_previous_run_adds_everything():
+    current = {"buy": [{"ticker": "AAPL", "shares": 1.0}], "sell": []}
+
+    diff = diff_recommendations(None, current)
+
+    assert [r["ticker"] for r in diff["added"]] == ["AAPL"]
+    assert diff["removed"] == diff["changed"] == []
+
+
+def test_tolerance_helpers():
+    assert not pct_moved(100.0, 100.4, 0.5)
+    assert pct_moved(100.0, 100.6, 0.5)
+    assert pct_moved(None, 100.0, 0.5)
+    assert not pct_moved(None, None, 0.5)
+
+    assert not points_moved(4.0, 4.5, 0.5)
+    assert points_moved(4.0, 4.6, 0.5)
+
+
+def test_is_stale():
+    now = datetime.datetime.now(datetime.UTC)
+    recent = (now - datetime.timedelta(minutes=5)).isoformat()
+    old = (now - datetime.timedelta(minutes=90)).isoformat()
+
+    assert not is_stale(recent, 60)
+    assert is_stale(old, 60)
+    assert is_stale(None, 60)
+    assert is_stale("not a timestamp", 60)
+
+
+def test_headline_fingerprint_ignores_order():
+    a = [{"title": "One"}, {"title": "Two"}]
+    b = [{"title": "Two"}, {"title": "One"}]
+
+    assert headline_fingerprint(a) == headline_fingerprint(b)
+    assert headline_fingerprint(a) != headline_fingerprint([{"title": "One"}])
+
+
+def test_state_round_trip_resets_per_run_fields(tmp_path):
+    path = tmp_path / "state.json"
+    state = new_state()
+    state["tickers"]["AAPL"] = {"price": 1.0}
+    state["recomputed"] = ["AAPL"]
+    save_state(state, path)
+
+    loaded = load_state(path)
+
+    assert loaded["tickers"] == {"AAPL": {"price": 1.0}}
+    assert loaded["recomputed"] == []
+
+
+def test_load_state_missing_or_corrupt(tmp_path):
+    assert load_state(tmp_path / "missing.json") == new_state()
+
+    corrupt = tmp_path / "corrupt.json"
+    corrupt.write_text("{not json")
+    assert load_state(corrupt) == new_state()
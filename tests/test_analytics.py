@@ -0,0 +1,192 @@
+import datetime
+
+import numpy as np
+import pytest
+
+import analytics
+from analytics import (
+    RollingStats,
+    diversify_weights,
+    load_stats,
+    save_stats,
+    volatility_stop_pcts,
+)
+
+TICKERS = ["AAA", "BBB", "CCC", "SPY"]
+
+
+def random_closes(days, n, seed=0):
+    rng = np.random.default_rng(seed)
+    return 100 * np.exp(np.cumsum(rng.normal(0, 0.02, (days, n)), axis=0))
+
+
+def filled_stats(days=200, window=30, seed=0):
+    closes = random_closes(days, len(TICKERS), seed)
+    stats = RollingStats(TICKERS, window)
+    for i, row in enumerate(closes):
+        stats.add_bar(str(i), row)
+    return stats, closes
+
+
+@pytest.mark.parametrize("days", [10, 31, 45, 200])
+def test_covariance_matches_numpy_over_window(days):
+    stats, closes = filled_stats(days=days, window=30)
+
+    returns = np.diff(np.log(closes), axis=0)[-30:]
+    np.testing.assert_allclose(stats.covariance(), np.cov(returns.T), atol=1e-12)
+
+
+def test_missing_close_carries_forward_as_zero_return():
+    stats = RollingStats(["AAA", "SPY"], 5)
+    stats.add_bar("d0", [100.0, 100.0])
+    stats.add_bar("d1", [np.nan, 101.0])
+
+    assert stats.returns[0][0] == 0.0
+    assert stats.last_prices[0] == 100.0
+
+
+def test_snapshot_beta_and_correlation():
+    stats, _ = filled_stats()
+    snap = stats.snapshot()
+
+    assert snap["beta"]["SPY"] == pytest.approx(1.0)
+    np.testing.assert_allclose(np.diag(snap["correlation"]), 1.0)
+    assert set(snap["volatility"]) == set(TICKERS)
+
+
+def test_save_load_round_trip_keeps_running_sums(tmp_path):
+    stats, _ = filled_stats()
+    path = tmp_path / "analytics.npz"
+    save_stats(stats, path)
+
+    loaded = load_stats(path)
+
+    np.testing.assert_array_equal(loaded.sum, stats.sum)
+    np.testing.assert_array_equal(loaded.cross, stats.cross)
+    assert (loaded.pos, loaded.count, loaded.last_date) == (
+        stats.pos,
+        stats.count,
+        stats.last_date,
+    )
+
+
+def test_load_rejects_old_format(tmp_path):
+    path = tmp_path / "old.npz"
+    np.savez(path, tickers=np.array(TICKERS), window=30)
+
+    assert load_stats(path) is None
+
+
+def test_volatility_stops_scale_and_clamp(monkeypatch):
+    monkeypatch.setattr(analytics, "STOP_VOL_MULTIPLIER", 2.0)
+    monkeypatch.setattr(analytics, "STOP_HORIZON_DAYS", 5)
+    monkeypatch.setattr(analytics, "MIN_STOP_LOSS_PCT", 3.0)
+    monkeypatch.setattr(analytics, "MAX_STOP_LOSS_PCT", 15.0)
+    monkeypatch.setattr(analytics, "STOP_LOSS_PCT", -5)
+    snap = {"volatility": {"MID": 0.3, "CALM": 0.05, "WILD": 2.0, "FLAT": 0.0}}
+
+    stops = volatility_stop_pcts(snap, ["MID", "CALM", "WILD", "FLAT", "NEW"])
+
+    assert stops["MID"] == pytest.approx(-2 * 0.3 * np.sqrt(5 / 252) * 100)
+    assert stops["CALM"] == -3.0
+    assert stops["WILD"] == -15.0
+    assert stops["FLAT"] == -5
+    assert stops["NEW"] == -5
+    assert volatility_stop_pcts(None, ["MID"]) == {"MID": -5}
+
+
+def test_diversify_weights_penalizes_correlated_names():
+    snap = {
+        "tickers": ["A", "B", "C"],
+        "correlation": np.array(
+            [[1.0, 0.9, -0.5], [0.9, 1.0, -0.5], [-0.5, -0.5, 1.0]]
+        ),
+    }
+    weights = {"A": 0.4, "B": 0.4, "C": 0.2}
+
+    adjusted = diversify_weights(weights, snap)
+
+    assert sum(adjusted.values()) == pytest.approx(1.0)
+    assert adjusted["A"] == pytest.approx(adjusted["B"])
+    assert adjusted["C"] > weights["C"]
+    assert adjusted["A"] < weights["A"]
+
+
+def test_diversify_weights_leaves_unknown_or_missing_analytics():
+    weights = {"A": 0.6, "Z": 0.4}
+    snap = {"tickers": ["A"], "correlation": np.array([[1.0]])}
+
+    assert diversify_weights(weights, snap) == weights
+    assert diversify_weights(weights, None) == weights
+
+
+def test_update_analytics_uses_benchmark_calendar(monkeypatch, tmp_path):
+    start = datetime.date.today() - datetime.timedelta(days=60)
+    dates = [(start + datetime.timedelta(days=i)).isoformat() for i in range(60)]
+    closes = random_closes(60, 2, seed=3)
+    # SPY (column 1) has no close on weekends; BTC-USD (column 0) trades daily
+    weekend = [
+        i for i in range(60) if (start + datetime.timedelta(days=i)).weekday() >= 5
+    ]
+    closes[weekend, 1] = np.nan
+    calls = []
+
+    def get_daily_closes(tickers, start=None):
+        calls.append(start)
+        return dates, closes
+
+    monkeypatch.setattr(analytics, "get_daily_closes", get_daily_closes)
+    monkeypatch.setattr(analytics, "tradable_symbols", lambda: ["BTC-USD"])
+    path = tmp_path / "analytics.npz"
+
+    snap = analytics.update_analytics([], path=path)
+
+    trading_days = [d for i, d in enumerate(dates) if i not in weekend]
+    trading_days = [d for d in trading_days if d < datetime.date.today().isoformat()]
+    stats = load_stats(path)
+    assert stats.count == min(len(trading_days) - 1, stats.window)
+    assert snap["as_of"] == trading_days[-1]
+    # No zero-return rows for SPY from weekends
+    assert np.count_nonzero(stats.returns[: stats.count, 1]) == stats.count
+    assert calls == [None]
+
+
+def test_load_treats_truncated_file_as_missing(tmp_path):
+    stats, _ = filled_stats()
+    path = tmp_path / "analytics.npz"
+    save_stats(stats, path)
+    path.write_bytes(path.read_bytes()[:100])
+
+    assert load_stats(path) is None
+
+
+def test_save_replaces_file_without_leaving_temp(tmp_path):
+    stats, _ = filled_stats()
+    path = tmp_path / "analytics.npz"
+    save_stats(stats, path)
+    save_stats(stats, path)
+
+    assert [p.name for p in tmp_path.iterdir()] == ["analytics.npz"]
+
+
+def test_update_analytics_fetches_at_most_once_a_day(monkeypatch, tmp_path):
+    # Bars end two days ago, as on a Monday or after a holiday
+    start = datetime.date.today() - datetime.timedelta(days=12)
+    dates = [(start + datetime.timedelta(days=i)).isoformat() for i in range(11)]
+    closes = random_closes(11, 2, seed=4)
+    calls = []
+
+    def get_daily_closes(tickers, start=None):
+        calls.append(start)
+        return dates, closes
+
+    monkeypatch.setattr(analytics, "get_daily_closes", get_daily_closes)
+    monkeypatch.setattr(analytics, "tradable_symbols", lambda: ["AAA"])
+    path = tmp_path / "analytics.npz"
+
+    for _ in range(4):
+        snap = analytics.update_analytics([], path=path)
+
+    assert calls == [None]
+    assert snap["as_of"] == dates[-1]
+    assert load_stats(path).checked_on == datetime.date.today().isoformat()
@@ -0,0 +1,99 @@
+import time
+
+import pytest
+
+from pipeline import Stage, fan_out, resolve_dependencies, run_stages
+
+
+def sleeper(seconds, value):
+    def func(**kwargs):
+        time.sleep(seconds)
+        return value
+
+    return func
+
+
+def test_values_flow_between_stages():
+    stages = [
+        Stage("double", lambda x: x * 2, inputs=["x"], outputs=["y"]),
+        Stage("split", lambda y: {"a": y, "b": -y}, inputs=["y"], outputs=["a", "b"]),
+        Stage("sum", lambda a, b, x: a + b + x, inputs=["a", "b", "x"], outputs=["z"]),
+    ]
+
+    values, _ = run_stages(stages, initial={"x": 3})
+
+    assert values == {"x": 3, "y": 6, "a": 6, "b": -6, "z": 3}
+
+
+def test_single_dict_output_is_not_unpacked():
+    stages = [Stage("prices", lambda: {"prices": 1, "AAPL": 2}, outputs=["prices"])]
+
+    values, _ = run_stages(stages)
+
+    assert values["prices"] == {"prices": 1, "AAPL": 2}
+
+
+def test_missing_input_rejected():
+    stages = [Stage("a", lambda nope: nope, inputs=["nope"], outputs=["a"])]
+
+    with pytest.raises(ValueError, match="unknown input 'nope'"):
+        run_stages(stages)
+
+
+def test_duplicate_output_rejected():
+    stages = [
+        Stage("a", lambda: 1, outputs=["x"]),
+        Stage("b", lambda: 2, outputs=["x"]),
+    ]
+
+    with pytest.raises(ValueError, match="produced more than once"):
+        resolve_dependencies(stages)
+
+
+def test_cycle_rejected():
+    stages = [
+        Stage("a", lambda y: y, inputs=["y"], outputs=["x"]),
+        Stage("b", lambda x: x, inputs=["x"], outputs=["y"]),
+        Stage("c", lambda: 0, outputs=["z"]),
+    ]
+
+    with pytest.raises(ValueError, match="Cycle between stages: a, b"):
+        run_stages(stages)
+
+
+def test_independent_stages_overlap_and_critical_path_is_slowest_chain():
+    stages = [
+        Stage("slow", sleeper(0.3, 1), outputs=["slow"]),
+        Stage("fast", sleeper(0.1, 2), outputs=["fast"]),
+        Stage("after_fast", sleeper(0.1, 3), inputs=["fast"], outputs=["after_fast"]),
+        Stage(
+            "join",
+            lambda slow, after_fast: slow + after_fast,
+            inputs=["slow", "after_fast"],
+            outputs=["join"],
+        ),
+    ]
+
+    values, report = run_stages(stages)
+
+    assert values["join"] == 4
+    # Sequential would be ~0.5s; concurrent is bounded by the 0.3s chain
+    assert report["total_seconds"] < 0.45
+    assert [step["stage"] for step in report["critical_path"]] == ["slow", "join"]
+    assert set(report["stages"]) == {"slow", "fast", "after_fast", "join"}
+
+
+def test_stage_errors_propagate():
+    def boom():
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError, match="boom"):
+        run_stages([Stage("boom", boom, outputs=["x"])])
+
+
+def test_fan_out_maps_every_item():
+    assert fan_out(lambda t: t.lower(), ["AAPL", "MSFT"]) == {
+        "AAPL": "aapl",
+        "MSFT": "msft",
+    }
+    assert fan_out(lambda t: t, []) == {}
@@ -0,0 +1,162 @@
+import os
+
+import pytest
+
+import advisor
+import fetch_prices
+import symbols
+from advisor_state import new_state
+
+HEADER = "symbol,name,sector,asset_class,exchange,liquidity\n"
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    """Point the store at a small CSV under tmp_path."""
+    csv_file = tmp_path / "symbols.csv"
+    csv_file.write_text(
+        HEADER
+        + "aapl,Apple Inc.,Technology,Equity,NASDAQ,high\n"
+        + "MSFT,Microsoft Corp.,Technology,equity,NASDAQ,high\n"
+        + "XOM,Exxon Mobil Corp.,Energy,equity,NYSE,medium\n"
+        + "TINY,Tiny Corp.,Industrials,equity,OTC,low\n"
+        + "SWVXX,Schwab Value Advantage Money Fund,Cash,cash,NASDAQ,low\n"
+        + "Cash & Cash Investments,Schwab cash sweep,Cash,cash,--,low\n"
+        + ",Missing symbol,Technology,equity,NYSE,high\n"
+        + "BAD,Bad liquidity,Technology,equity,NYSE,huge\n"
+    )
+    monkeypatch.setattr(symbols, "SYMBOLS_CSV", csv_file)
+    return csv_file
+
+
+@pytest.fixture
+def no_network(monkeypatch):
+    def download(**kwargs):
+        raise AssertionError("network fetch attempted")
+
+    monkeypatch.setattr(fetch_prices, "download", download)
+    monkeypatch.setattr(advisor, "get_prices", lambda tickers: download())
+
+
+def test_build_skips_invalid_rows(store, symbol_store):
+    symbols.build_symbol_db(store, symbol_store)
+
+    index = symbols.load_symbols(symbol_store, store)
+
+    assert set(index) == {
+        "AAPL",
+        "MSFT",
+        "XOM",
+        "TINY",
+        "SWVXX",
+        "CASH & CASH INVESTMENTS",
+    }
+    assert index["AAPL"]["asset_class"] == "equity"
+    assert not list(symbol_store.parent.glob("*.tmp"))
+
+
+def test_load_builds_missing_db_and_rebuilds_when_csv_is_newer(store, symbol_store):
+    assert "NVDA" not in symbols.load_symbols(symbol_store, store)
+    built = symbol_store.stat().st_mtime
+
+    # Older CSV: the existing store is reused
+    os.utime(store, (built - 10, built - 10))
+    symbols.load_symbols(symbol_store, store)
+    assert symbol_store.stat().st_mtime == built
+
+    with open(store, "a") as f:
+        f.write("NVDA,Nvidia Corp.,Technology,equity,NASDAQ,high\n")
+    os.utime(store, (built + 10, built + 10))
+
+    assert "NVDA" in symbols.load_symbols(symbol_store, store)
+
+
+def test_index_loaded_once(store, monkeypatch):
+    first = symbols.get_index()
+    monkeypatch.setattr(symbols, "load_symbols", lambda: pytest.fail("reloaded"))
+
+    assert symbols.get_index() is first
+
+
+def test_validate_symbols_rejects_unknown_cash_and_illiquid(store, no_network):
+    valid, rejected = symbols.validate_symbols(
+        ["aapl", "XOM", "TINY", "SWVXX", "JSON", "BAD"], min_liquidity="medium"
+    )
+
+    assert valid == ["AAPL", "XOM"]
+    assert rejected == ["TINY", "SWVXX", "JSON", "BAD"]
+
+
+def test_gpt_suggestions_are_validated_before_any_fetch(store, no_network, monkeypatch):
+    asked = {}
+
+    def suggest(preferred_universe=None, exclude=None, max_count=5):
+        asked["universe"] = preferred_universe
+        return ["XOM", "JSON", "SWVXX", "TINY"]
+
+    monkeypatch.setattr(advisor, "suggest_high_performing_tickers", suggest)
+    monkeypatch.setattr(advisor, "MIN_SUGGESTION_LIQUIDITY", "medium")
+    state = new_state()
+
+    tickers = advisor.get_gpt_suggestions(state, exclude=["AAPL"])
+
+    assert tickers == ["XOM"]
+    assert state["gpt_suggestions"]["tickers"] == ["XOM"]
+    assert sorted(asked["universe"]) == ["AAPL", "MSFT", "XOM"]
+
+
+def test_is_cash_symbol(store):
+    assert symbols.is_cash_symbol("Cash & Cash Investments")
+    assert symbols.is_cash_symbol("SWVXX")
+    assert symbols.is_cash_symbol(" swvxx ")
+    assert not symbols.is_cash_symbol("AAPL")
+    assert not symbols.is_cash_symbol("UNKNOWN")
+
+
+def test_tradable_symbols_filters_cash_and_liquidity(store):
+    assert sorted(symbols.tradable_symbols()) == ["AAPL", "MSFT", "TINY", "XOM"]
+    assert sorted(symbols.tradable_symbols("medium")) == ["AAPL", "MSFT", "XOM"]
+    assert sorted(symbols.tradable_symbols("high")) == ["AAPL", "MSFT"]
+
+
+def test_get_sector(store):
+    assert symbols.get_sector("msft") == "Technology"
+    assert symbols.get_sector("ZZZZ") == "Unknown"
+
+
+def test_cap_sector_weights_scales_capped_sector_only(store):
+    weights = {"AAPL": 0.4, "MSFT": 0.4, "XOM": 0.2}
+
+    capped = advisor.cap_sector_weights(weights, 0.5)
+
+    assert capped["AAPL"] == pytest.approx(0.25)
+    assert capped["MSFT"] == pytest.approx(0.25)
+    assert capped["XOM"] == pytest.approx(0.2)
+
+
+def test_cap_sector_weights_leaves_unknown_sector_uncapped(store):
+    weights = {"ZZZ1": 0.45, "ZZZ2": 0.45, "XOM": 0.1}
+
+    assert advisor.cap_sector_weights(weights, 0.5) == weights
+
+
+def test_sector_capped_cash_reports_what_the_cap_held_back(store):
+    weights = advisor.cap_sector_weights({"AAPL": 0.4, "MSFT": 0.4, "XOM": 0.2}, 0.5)
+    prices = {"AAPL": 100.0, "MSFT": 100.0, "XOM": 100.0}
+
+    buys = advisor.allocate_cash_weighted_by_performance(
+        [("AAPL", 4.0), ("MSFT", 4.0), ("XOM", 2.0)],
+        prices,
+        1000.0,
+        {},
+        weights=weights,
+    )
+    unallocated = advisor.sector_capped_cash(weights, 1000.0)
+
+    assert unallocated == pytest.approx(300.0)
+    assert sum(b["cost_usd"] for b in buys) + unallocated == pytest.approx(1000.0)
+
+
+def test_sector_capped_cash_is_zero_without_cap_or_weights(store):
+    assert advisor.sector_capped_cash({"AAPL": 0.5, "XOM": 0.5}, 1000.0) == 0.0
+    assert advisor.sector_capped_cash({}, 1000.0) == 0.0
@@ -0,0 +1,90 @@
+from watcher import StopWatcher, simulated_quote_feed
+
+
+def make_watcher(stop_loss_pct=-5):
+    alerts = []
+    watcher = StopWatcher(stop_loss_pct=stop_loss_pct, on_alert=alerts.append)
+    watcher.load_holdings(
+        [
+            {"ticker": "AAPL", "shares": 2, "market_value": 400},  # avg 200, stop 190
+            {"ticker": "AAPL", "shares": 1, "market_value": 180},  # avg 180, stop 171
+            {"ticker": "SPY", "shares": 1, "market_value": 500},  # avg 500, stop 475
+            {"ticker": "CASH", "shares": 0, "market_value": 100},  # ignored
+        ]
+    )
+    return watcher, alerts
+
+
+def test_stops_derived_from_average_price():
+    watcher, _ = make_watcher()
+
+    assert watcher.stops == {"AAPL": [171.0, 190.0], "SPY": [475.0]}
+    assert sorted(watcher.watched_tickers()) == ["AAPL", "SPY"]
+
+
+def test_per_ticker_stop_pcts_override_default():
+    watcher = StopWatcher(on_alert=lambda alert: None)
+    watcher.load_holdings(
+        [{"ticker": "NVDA", "shares": 1, "market_value": 100}], {"NVDA": -12}
+    )
+
+    assert watcher.stops["NVDA"] == [88.0]
+
+
+def test_quotes_above_stop_do_not_alert():
+    watcher, alerts = make_watcher()
+
+    assert watcher.on_quote("AAPL", 190.01) == []
+    assert watcher.on_quote("MSFT", 1.0) == []
+    assert watcher.on_quote("AAPL", None) == []
+    assert alerts == []
+
+
+def test_alert_fires_at_stop_and_only_once():
+    watcher, alerts = make_watcher()
+
+    fired = watcher.on_quote("AAPL", 190.0)
+    assert [a["stop_price"] for a in fired] == [190.0]
+    assert fired[0]["shares"] == 2
+
+    # Same level again: already fired
+    assert watcher.on_quote("AAPL", 185.0) == []
+
+    # Falling through both remaining and fired levels only fires the lower lot
+    fired = watcher.on_quote("AAPL", 150.0)
+    assert [a["stop_price"] for a in fired] == [171.0]
+    assert watcher.on_quote("AAPL", 100.0) == []
+
+    assert len(alerts) == 2
+    assert "AAPL" not in watcher.watched_tickers()
+
+
+def test_simulated_feed_alerts_once_at_first_crossing():
+    watcher, alerts = make_watcher()
+    stops = {t: list(levels) for t, levels in watcher.stops.items()}
+    quotes = list(
+        simulated_quote_feed({"AAPL": 200.0, "SPY": 500.0}, steps=500, seed=7)
+    )
+
+    watcher.run(quotes)
+
+    expected = []
+    for ticker, levels in stops.items():
+        for stop in levels:
+            first = next((p for t, p in quotes if t == ticker and p <= stop), None)
+            if first is not None:
+                expected.append((ticker, round(stop, 2), first))
+
+    assert expected, "seed should drive at least one stop through"
+    assert sorted((a["ticker"], a["stop_price"], a["price"]) for a in alerts) == sorted(
+        expected
+    )
+    assert all(a["price"] <= a["stop_price"] for a in alerts)
+
+
+def test_simulated_feed_is_reproducible():
+    def feed():
+        return list(simulated_quote_feed({"AAPL": 100.0}, steps=20, seed=1))
+
+    assert feed() == feed()
+    assert len(feed()) == 20
@@ -0,0 +1,174 @@
+import bisect
+import json
+import random
+import sys
+import time
+
+from config import JSON_FILE, STOP_LOSS_PCT
+
+
+# -----------------------------
+# Stop Index
+# -----------------------------
+class StopWatcher:
+    """
+    Evaluate holdings' stop levels against a stream of quote updates.
+
+    Stop prices are derived from each holding's average price
+    (market_value / shares) and kept in a per-ticker sorted list, so each
+    quote is checked with a single bisect instead of re-running the advisor.
+    A stop fires once and is then removed until holdings are reloaded.
+    """
+
+    def __init__(self, stop_loss_pct=STOP_LOSS_PCT, on_alert=None):
+        self.stop_loss_pct = stop_loss_pct
+        self.on_alert = on_alert or print_alert
+        self.stops = {}  # ticker -> sorted list of stop prices
+        self.entries = {}  # ticker -> list of holding dicts, parallel to stops
+
+    def load_holdings(self, holdings, stop_pcts=None):
+        """
+        Index stops for holdings.
+
+        stop_pcts: optional per-ticker stop-loss % (e.g. from
+        analytics.volatility_stop_pcts); self.stop_loss_pct otherwise
+        """
+        stop_pcts = stop_pcts or {}
+        self.stops.clear()
+        self.entries.clear()
+        for h in holdings:
+            shares = h.get("shares", 0)
+            market_value = h.get("market_value", 0)
+            if not shares or not market_value:
+                continue
+            avg_price = market_value / shares
+            stop_pct = stop_pcts.get(h["ticker"], self.stop_loss_pct)
+            stop_price = avg_price * (1 + stop_pct / 100)
+            self.add_stop(h["ticker"], stop_price, {**h, "avg_price": avg_price})
+
+    def add_stop(self, ticker, stop_price, holding):
+        stops = self.stops.setdefault(ticker, [])
+        entries = self.entries.setdefault(ticker, [])
+        i = bisect.bisect_right(stops, stop_price)
+        stops.insert(i, stop_price)
+        entries.insert(i, {**holding, "stop_price": stop_price})
+
+    def on_quote(self, ticker, price):
+        """
+        Process one quote update. Every stop at or above price fires.
+
+        Returns: list of sell alerts emitted for this quote
+        """
+        stops = self.stops.get(ticker)
+        if not stops or price is None:
+            return []
+
+        i = bisect.bisect_left(stops, price)
+        if i == len(stops):
+            return []
+
+        triggered = self.entries[ticker][i:]
+        del stops[i:]
+        del self.entries[ticker][i:]
+
+        alerts = []
+        for h in triggered:
+            change_pct = (price - h["avg_price"]) / h["avg_price"] * 100
+            alert = {
+                "ticker": ticker,
+                "shares": h.get("shares", 0),
+                "price": price,
+                "stop_price": round(h["stop_price"], 2),
+                "reason": f"Down {change_pct:.2f}% from avg price",
+            }
+            self.on_alert(alert)
+            alerts.append(alert)
+        return alerts
+
+    def run(self, feed):
+        """Consume an iterable of (ticker, price) quotes until exhausted."""
+        alerts = []
+        for ticker, price in feed:
+            alerts.extend(self.on_quote(ticker, price))
+        return alerts
+
+    def watched_tickers(self):
+        return [t for t, stops in self.stops.items() if stops]
+
+
+def print_alert(alert):
+    print(
+        f"🚨 Sell {alert['shares']} shares of {alert['ticker']} at "
+        f"${alert['price']:.2f} (stop ${alert['stop_price']:.2f}, {alert['reason']})"
+    )
+
+
+# -----------------------------
+# Quote Feeds
+# -----------------------------
+def simulated_quote_feed(
+    start_prices, steps=100, volatility_pct=1.0, interval=0.0, seed=None
+):
+    """
+    Local random-walk quote feed for testing the watcher without a network.
+
+    start_prices: dict {ticker: starting price}
+    steps: number of quotes per ticker
+    volatility_pct: standard deviation of each tick's % move
+    interval: seconds to sleep between quotes
+
+    Yields: (ticker, price) tuples
+    """
+    rng = random.Random(seed)
+    prices = dict(start_prices)
+    for _ in range(steps):
+        for ticker in prices:
+            prices[ticker] *= 1 + rng.gauss(0, volatility_pct / 100)
+            yield ticker, round(prices[ticker], 2)
+            if interval:
+                time.sleep(interval)
+
+
+def watch_live(watcher):
+    """Stream live quotes for watched tickers from Yahoo Finance's websocket."""
+    import yfinance as yf
+
+    def handle(message):
+        ticker = message.get("id")
+        price = message.get("price")
+        if ticker and price is not None:
+            watcher.on_quote(ticker, float(price))
+
+    with yf.WebSocket() as ws:
+        ws.subscribe(watcher.watched_tickers())
+        ws.listen(handle)
+
+
+# -----------------------------
+# Entry Point
+# -----------------------------
+if __name__ == "__main__":
+    with open(JSON_FILE, "r", encoding="utf-8") as f:
+        account_data = json.load(f)
+
+    holdings = account_data.get("holdings", [])
+    watcher = StopWatcher()
+    if "--simulate" in sys.argv:
+        watcher.load_holdings(holdings)
+    else:
+        from analytics import update_analytics, volatility_stop_pcts
+
+        tickers = [h["ticker"] for h in holdings]
+        stop_pcts = volatility_stop_pcts(update_analytics(tickers), tickers)
+        watcher.load_holdings(holdings, stop_pcts)
+    print(f"Watching stops for: {', '.join(watcher.watched_tickers()) or 'none'}")
+
+    if "--simulate" in sys.argv:
+        start_prices = {
+            h["ticker"]: h["market_value"] / h["shares"]
+            for h in account_data.get("holdings", [])
+            if h.get("shares") and h.get("market_value")
+        }
+        watcher.run(simulated_quote_feed(start_prices, interval=0.05))
+    else:
+        watch_live(watcher)